@@ -5,23 +5,89 @@ Glimpse - A command-line tool for image analysis using OpenRouter API.
 
 import os
 import sys
-import base64
-import json
-import argparse
-import configparser
+import gzip
+import zlib
+import mmap
+import re
 import time
 import tempfile
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
-import requests
-from PIL import Image
+try:
+    import pybase64 as base64
+except ImportError:  # Fall back to the stdlib codec if the SIMD wheel is missing
+    import base64
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:  # Fall back to the stdlib codec, producing bytes like orjson
+    import json
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+
+# Matches "[section]" headers and "key = value" lines, dropping trailing " # comments" from both
+CONFIG_LINE_RE = re.compile(
+    r"^[ \t]*(?:\[([^\]]+)\](?:[ \t]+[#;].*)?|([A-Za-z_][\w.-]*)[ \t]*[=:][ \t]*(.*?)(?:[ \t]+[#;].*)?)[ \t]*$",
+    re.MULTILINE
+)
+
+
+def parse_config(text: str) -> dict:
+    """Parse a flat INI file into a {section: {key: value}} dict."""
+    sections = {}
+    current = None
+    for section, key, value in CONFIG_LINE_RE.findall(text):
+        if section:
+            current = sections.setdefault(section.strip(), {})
+        elif current is not None:
+            current[key.lower()] = value
+    return sections
+
+
+# Config file locations, preferred first; the INI file is still read for older setups
+CONFIG_PATHS = ("~/.glimpse_cfg.toml", "~/.glimpse_cfg")
+
+# tomllib, needed for the TOML config, is only in the stdlib from Python 3.11
+TOML_SUPPORTED = sys.version_info >= (3, 11)
+
+
+def get_config_path():
+    """Return the config file to use, or the preferred location if none exists."""
+    for path in CONFIG_PATHS:
+        config_path = os.path.expanduser(path)
+        if os.path.exists(config_path):
+            return config_path
+    # Without tomllib, point new users at the INI file they can actually use
+    return os.path.expanduser(CONFIG_PATHS[0] if TOML_SUPPORTED else CONFIG_PATHS[1])
+
+
+def read_config_file(config_path: str) -> dict:
+    """Read the [openrouter] section of the config, as TOML or as the legacy INI format."""
+    if not config_path.endswith(".toml"):
+        # Text mode so CRLF line endings are normalized before parsing
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return parse_config(f.read()).get('openrouter', {})
+    
+    try:
+        import tomllib
+    except ImportError:
+        raise RuntimeError(f"{config_path} requires Python 3.11 or newer; use the INI format in ~/.glimpse_cfg instead")
+    
+    with open(config_path, 'rb') as f:
+        return tomllib.load(f).get('openrouter', {})
 
 
 def load_config():
-    """Load configuration from $HOME/.glimpse_cfg file."""
-    config_path = os.path.expanduser("~/.glimpse_cfg")
-    config = configparser.ConfigParser()
+    """Load configuration from $HOME/.glimpse_cfg.toml (or the older $HOME/.glimpse_cfg)."""
+    config_path = get_config_path()
     
     # Default values
     default_model = "google/gemini-2.5-flash"
@@ -29,63 +95,131 @@ def load_config():
     
     # Config file existence is already checked in main()
     try:
-        config.read(config_path)
+        config = read_config_file(config_path)
         
         # Get API key (required)
-        if 'openrouter' in config and 'api_key' in config['openrouter']:
-            api_key = config['openrouter']['api_key']
-        else:
+        api_key = config.get('api_key')
+        if api_key is None:
             print("Error: Missing 'api_key' in [openrouter] section of config file.", file=sys.stderr)
-            print("Please add your OpenRouter API key to ~/.glimpse_cfg", file=sys.stderr)
+            print(f"Please add your OpenRouter API key to {config_path}", file=sys.stderr)
             sys.exit(1)
             
         # Get model (optional, use default if not specified)
-        if 'openrouter' in config and 'model' in config['openrouter']:
-            model = config['openrouter']['model']
-        else:
+        model = config.get('model')
+        if model is None:
             model = default_model
             print(f"Notice: Using default model: {default_model}", file=sys.stderr)
         
         # Get temperature (optional, use default if not specified)
-        if 'openrouter' in config and 'temperature' in config['openrouter']:
-            try:
-                temperature = float(config['openrouter']['temperature'])
-            except ValueError:
-                print(f"Warning: Invalid temperature value in config. Using default: {default_temperature}", file=sys.stderr)
-                temperature = default_temperature
-        else:
+        try:
+            temperature = float(config.get('temperature', default_temperature))
+        except (ValueError, TypeError):
+            print(f"Warning: Invalid temperature value in config. Using default: {default_temperature}", file=sys.stderr)
             temperature = default_temperature
             
     except Exception as e:
         print(f"Error reading config file: {e}", file=sys.stderr)
         print("Please ensure the file has the correct format:", file=sys.stderr)
-        print("[openrouter]\napi_key = your_api_key_here", file=sys.stderr)
+        if config_path.endswith(".toml"):
+            print('[openrouter]\napi_key = "your_api_key_here"', file=sys.stderr)
+        else:
+            print("[openrouter]\napi_key = your_api_key_here", file=sys.stderr)
         sys.exit(1)
         
     return api_key, model, temperature
 
 
-def encode_image(image_path):
-    """Encode image to base64."""
-    try:
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
-    except Exception as e:
-        print(f"Error encoding image: {e}", file=sys.stderr)
-        sys.exit(1)
+# MIME type sent in the data URL for each supported image extension
+IMAGE_MIME_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
+SUPPORTED_SUFFIXES = frozenset(IMAGE_MIME_TYPES)
 
+# Maximum number of images analyzed concurrently
+MAX_WORKERS = 8
 
-def analyze_image(image_path: str, prompt: str, api_key: str, model: str, temperature: Optional[float] = None) -> str:
-    """Send image to OpenRouter API and get the analysis."""
-    base64_image = encode_image(image_path)
-    
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "X-Title": "glimpse",
-        "HTTP-Referer": "https://github.com/u1i/glimpse"
-    }
-    
+# Shared HTTP session, created on first use
+_session = None
+
+
+def get_session():
+    """Return a shared requests session so TCP/TLS connections are reused across calls."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        _session = requests.Session()
+        # Retry failed connections for any request; read errors and 5xx responses
+        # are only retried for idempotent methods, so the chat POST isn't resent
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+        # Keep enough pooled connections for every analyze_images worker
+        _session.mount("https://", HTTPAdapter(pool_maxsize=MAX_WORKERS, max_retries=retries))
+        _session.headers.update({
+            "X-Title": "glimpse",
+            "HTTP-Referer": "https://github.com/u1i/glimpse"
+        })
+    return _session
+
+
+# Read size for streaming encode; a multiple of 3 so chunks concatenate without padding
+ENCODE_CHUNK_SIZE = 57 * 1024
+
+# Stand-in for the data URL while the payload is serialized
+IMAGE_URL_PLACEHOLDER = "__GLIMPSE_IMAGE_URL__"
+
+
+def encoded_length(size: int) -> int:
+    """Return the length of the base64 encoding of size bytes."""
+    return 4 * ((size + 2) // 3)
+
+
+def encode_image(image_data):
+    """Encode image data (bytes or a memory map) to base64, yielding one chunk at a time."""
+    for offset in range(0, len(image_data), ENCODE_CHUNK_SIZE):
+        yield base64.b64encode(image_data[offset:offset + ENCODE_CHUNK_SIZE])
+
+
+class StreamingPayload:
+    """Request body that streams the base64 image between a JSON prefix and suffix.
+
+    Defining __len__ lets requests send a Content-Length header instead of
+    falling back to chunked transfer encoding.
+    """
+
+    def __init__(self, prefix: bytes, image_data, suffix: bytes):
+        self.prefix = prefix
+        self.image_data = image_data
+        self.suffix = suffix
+        self.length = len(prefix) + encoded_length(len(image_data)) + len(suffix)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        yield self.prefix
+        yield from encode_image(self.image_data)
+        yield self.suffix
+
+
+def read_image(image_path: Path):
+    """Return the image contents, memory-mapped unless the file is too small to benefit."""
+    with image_path.open("rb") as image_file:
+        # Map the file so chunks are read straight from the page cache
+        if os.fstat(image_file.fileno()).st_size >= mmap.PAGESIZE:
+            try:
+                return mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                pass  # Not mappable (e.g. a special file), so read it instead
+        # Sized from fstat, so this is a single read into an exact-size buffer
+        return image_file.read()
+
+
+@lru_cache(maxsize=None)
+def payload_template(model: str, prompt: str, temperature: Optional[float], mime: str):
+    """Serialize the request payload once, returning the JSON before and after the image data.
+
+    Cached so a batch of images sharing a prompt and model reuses the same bytes.
+    """
     payload = {
         "model": model,
         "messages": [
@@ -93,7 +227,7 @@ def analyze_image(image_path: str, prompt: str, api_key: str, model: str, temper
                 "role": "user",
                 "content": [
                     {"type": "text", "text": prompt},
-                    {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{base64_image}"}}
+                    {"type": "image_url", "image_url": {"url": IMAGE_URL_PLACEHOLDER}}
                 ]
             }
         ]
@@ -103,27 +237,90 @@ def analyze_image(image_path: str, prompt: str, api_key: str, model: str, temper
     if temperature is not None:
         payload["temperature"] = temperature
     
+    # The image URL is the last string in the payload, so split on the last placeholder
+    prefix, _, suffix = json_dumps(payload).rpartition(IMAGE_URL_PLACEHOLDER.encode("ascii"))
+    return prefix + f"data:{mime};base64,".encode("ascii"), suffix
+
+
+def analyze_image(image_path: str, prompt: str, api_key: str, model: str, temperature: Optional[float] = None, mime: str = "image/jpeg") -> str:
+    """Send image to OpenRouter API and get the analysis."""
+    # Imported lazily so --help and cached --list-models skip the requests import chain
+    import requests
+    
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+    
+    prefix, suffix = payload_template(model, prompt, temperature, mime)
+    
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers=headers,
-            json=payload
-        )
+        image_data = read_image(Path(image_path))
+    except Exception as e:
+        print(f"Error encoding image: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    try:
+        try:
+            response = get_session().post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers=headers,
+                data=StreamingPayload(prefix, image_data, suffix)
+            )
+        finally:
+            if isinstance(image_data, mmap.mmap):
+                image_data.close()
         response.raise_for_status()
         
-        result = response.json()
+        result = json_loads(response.content)
         return result["choices"][0]["message"]["content"]
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error calling OpenRouter API: {e}", file=sys.stderr)
         if hasattr(e, 'response') and e.response:
             print(f"Response status code: {e.response.status_code}", file=sys.stderr)
             print(f"Response body: {e.response.text}", file=sys.stderr)
         sys.exit(1)
+    except (KeyError, IndexError, TypeError):
+        print("Error calling OpenRouter API: Unexpected response format", file=sys.stderr)
+        print(f"Response body: {response.text}", file=sys.stderr)
+        sys.exit(1)
+
+
+def analyze_images(image_paths, prompt: str, api_key: str, model: str, temperature: Optional[float] = None, max_workers: int = MAX_WORKERS):
+    """Analyze several images concurrently, yielding the results in input order.
+    
+    With more than one image, a failed analysis yields None instead of exiting,
+    so the results of the other images are still returned.
+    """
+    def analyze(image_path):
+        # Send the MIME type matching the file so the provider doesn't have to sniff it
+        mime = IMAGE_MIME_TYPES.get(Path(image_path).suffix.lower(), "image/jpeg")
+        return analyze_image(image_path, prompt, api_key, model, temperature, mime)
+    
+    if len(image_paths) == 1:
+        yield analyze(image_paths[0])
+        return
+    
+    def analyze_or_none(image_path):
+        try:
+            return analyze(image_path)
+        except SystemExit:
+            # analyze_image has already reported the error
+            return None
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Create the shared session up front so all workers use the same connection pool
+    get_session()
+    
+    # Never use more workers than the session's connection pool holds
+    with ThreadPoolExecutor(max_workers=min(max_workers, MAX_WORKERS, len(image_paths))) as executor:
+        yield from executor.map(analyze_or_none, image_paths)
 
 
 def get_cache_file_path():
     """Get the path for the models cache file."""
-    return os.path.join(tempfile.gettempdir(), 'glimpse_models_cache.json')
+    return os.path.join(tempfile.gettempdir(), 'glimpse_models_cache.json.gz')
 
 
 def is_cache_valid(cache_file_path, max_age_hours=6):
@@ -139,20 +336,32 @@ def is_cache_valid(cache_file_path, max_age_hours=6):
 def load_models_from_cache(cache_file_path):
     """Load models data from cache file."""
     try:
-        with open(cache_file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        with open(cache_file_path, 'rb') as f:
+            data = f.read()
+        # Accept plain JSON too, in case the file wasn't written compressed
+        if data[:2] == b'\x1f\x8b':
+            data = gzip.decompress(data)
+        return json_loads(data)
+    except (ValueError, EOFError, IOError, zlib.error):
         return None
 
 
 def save_models_to_cache(models_data, cache_file_path):
     """Save models data to cache file."""
+    tmp_path = None
     try:
-        with open(cache_file_path, 'w', encoding='utf-8') as f:
-            json.dump(models_data, f)
+        # Write to a temp file and rename it into place so readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(cache_file_path), delete=False) as f:
+            tmp_path = f.name
+            f.write(gzip.compress(json_dumps(models_data), compresslevel=6))
+        os.replace(tmp_path, cache_file_path)
     except IOError:
         # If we can't write to cache, just continue without caching
-        pass
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except IOError:
+                pass
 
 
 def fetch_models_data():
@@ -166,18 +375,20 @@ def fetch_models_data():
             return cached_data
     
     # Cache miss or invalid - fetch from API
+    import requests
+    
     try:
-        response = requests.get("https://openrouter.ai/api/v1/models")
+        response = get_session().get("https://openrouter.ai/api/v1/models")
         response.raise_for_status()
         
-        models_data = response.json()
+        models_data = json_loads(response.content)
         
         # Save to cache
         save_models_to_cache(models_data, cache_file_path)
         
         return models_data
         
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         # If API fails, try to load from cache even if expired
         cached_data = load_models_from_cache(cache_file_path)
         if cached_data is not None:
@@ -198,75 +409,90 @@ def list_models(detailed=True):
             models = models_data  # Fallback if response format is different
         
         # Filter models that support image input
-        image_models = []
-        for model in models:
-            architecture = model.get('architecture', {})
-            modalities = architecture.get('input_modalities', [])
-            if 'image' in modalities:
-                image_models.append(model)
+        image_models = [
+            model for model in models
+            if 'image' in model.get('architecture', {}).get('input_modalities', ())
+        ]
+        
+        # Build the whole listing and write it in one go
+        lines = [f"Available OpenRouter Models with Image Support ({len(image_models)} total):"]
         
         if detailed:
-            print(f"Available OpenRouter Models with Image Support ({len(image_models)} total):")
-            print("=" * 70)
+            separator = "-" * 70
+            lines.append("=" * 70)
             
             for model in image_models:
-                model_id = model.get('id', 'Unknown')
-                name = model.get('name', 'Unknown')
-                context_length = model.get('context_length', 'Unknown')
-                
                 # Get pricing info
                 pricing = model.get('pricing', {})
-                prompt_price = pricing.get('prompt', '0')
-                completion_price = pricing.get('completion', '0')
                 
                 # Format pricing (convert to more readable format)
                 try:
-                    prompt_cost = f"${float(prompt_price) * 1000:.4f}/1K"
-                    completion_cost = f"${float(completion_price) * 1000:.4f}/1K"
+                    prompt_cost = f"${float(pricing.get('prompt', '0')) * 1000:.4f}/1K"
+                    completion_cost = f"${float(pricing.get('completion', '0')) * 1000:.4f}/1K"
                 except (ValueError, TypeError):
                     prompt_cost = "N/A"
                     completion_cost = "N/A"
                 
-                print(f"ID: {model_id}")
-                print(f"Name: {name}")
-                print(f"Context: {context_length} tokens")
-                print(f"Pricing: {prompt_cost} prompt, {completion_cost} completion")
+                lines.append(
+                    f"ID: {model.get('id', 'Unknown')}\n"
+                    f"Name: {model.get('name', 'Unknown')}\n"
+                    f"Context: {model.get('context_length', 'Unknown')} tokens\n"
+                    f"Pricing: {prompt_cost} prompt, {completion_cost} completion"
+                )
                 
                 # Add description if available and not too long
                 description = model.get('description', '')
                 if description and len(description) <= 100:
-                    print(f"Description: {description}")
+                    lines.append(f"Description: {description}")
                 elif description:
-                    print(f"Description: {description[:97]}...")
+                    lines.append(f"Description: {description[:97]}...")
                 
-                print("-" * 70)
+                lines.append(separator)
         else:
             # Simple list of model IDs only
-            print(f"Available OpenRouter Models with Image Support ({len(image_models)} total):")
-            for model in image_models:
-                model_id = model.get('id', 'Unknown')
-                print(model_id)
+            lines.extend(model.get('id', 'Unknown') for model in image_models)
+        
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
             
     except Exception as e:
         print(f"Error fetching models: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def main():
-    """Main function to handle command line arguments and process the image."""
+DEFAULT_PROMPT = "Describe what you see in the image"
+
+# Command-line options taking a value, mapped to (attribute, type)
+VALUE_OPTIONS = {
+    "--prompt": ("prompt", str), "-p": ("prompt", str),
+    "--model": ("model", str), "-m": ("model", str),
+    "--temperature": ("temperature", float), "-t": ("temperature", float),
+}
+
+# Command-line switches, mapped to their attribute
+FLAG_OPTIONS = {
+    "--list-models": "list_models",
+    "--list-models-with-details": "list_models_with_details",
+}
+
+
+def build_arg_parser():
+    """Build the full argparse parser, used for --help and anything parse_args can't handle."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Analyze images using OpenRouter API.")
     parser.add_argument(
-        "image_path", 
-        nargs='?',
+        "image_paths", 
+        nargs='*',
         type=str, 
-        help="Path to the image file (JPG or PNG)"
+        help="Path(s) to the image file(s) (JPG or PNG); multiple images are analyzed in parallel"
     )
     parser.add_argument(
         "--prompt", 
         "-p", 
         type=str, 
-        default="Describe what you see in the image",
-        help="Prompt to send with the image (default: 'Describe what you see in the image')"
+        default=DEFAULT_PROMPT,
+        help=f"Prompt to send with the image (default: '{DEFAULT_PROMPT}')"
     )
     parser.add_argument(
         "--model",
@@ -290,8 +516,53 @@ def main():
         action='store_true', 
         help="List all available OpenRouter models with image support and detailed information"
     )
+    return parser
+
+
+def parse_args(argv):
+    """Parse command-line arguments without argparse for the common cases.
     
-    args = parser.parse_args()
+    Help requests, unknown options and malformed values fall through to
+    argparse, which produces the usual usage and error messages.
+    """
+    args = SimpleNamespace(
+        image_paths=[],
+        prompt=DEFAULT_PROMPT,
+        model=None,
+        temperature=None,
+        list_models=False,
+        list_models_with_details=False
+    )
+    
+    i = 0
+    try:
+        while i < len(argv):
+            arg = argv[i]
+            if arg in VALUE_OPTIONS:
+                name, convert = VALUE_OPTIONS[arg]
+                value = argv[i + 1]
+                if value.startswith("-"):
+                    raise ValueError(value)
+                setattr(args, name, convert(value))
+                i += 2
+            elif arg in FLAG_OPTIONS:
+                setattr(args, FLAG_OPTIONS[arg], True)
+                i += 1
+            elif arg.startswith("-"):
+                raise ValueError(arg)
+            else:
+                args.image_paths.append(arg)
+                i += 1
+    except (IndexError, ValueError):
+        # Intermixed parsing accepts image paths on both sides of an option, like the loop above
+        return build_arg_parser().parse_intermixed_args(argv)
+    
+    return args
+
+
+def main():
+    """Main function to handle command line arguments and process the image."""
+    args = parse_args(sys.argv[1:])
     
     # Handle --list-models commands
     if args.list_models:
@@ -302,32 +573,37 @@ def main():
         list_models(detailed=True)
         sys.exit(0)
     
-    # Check if image_path is provided for analysis
-    if not args.image_path:
+    # Check if image paths are provided for analysis
+    if not args.image_paths:
         print("Error: Image path is required for analysis.", file=sys.stderr)
         print("Use --help for usage information or --list-models to see available models.", file=sys.stderr)
         sys.exit(1)
     
     # Check if config file exists
-    config_path = os.path.expanduser("~/.glimpse_cfg")
+    config_path = get_config_path()
     if not os.path.exists(config_path):
         print(f"Error: Config file not found at {config_path}", file=sys.stderr)
         print("\nPlease create a config file with your OpenRouter API key:", file=sys.stderr)
-        print("\n[openrouter]\napi_key = your_api_key_here\n", file=sys.stderr)
-        print("Optional settings:\nmodel = google/gemini-2.5-flash\ntemperature = 0.4\n", file=sys.stderr)
+        if config_path.endswith(".toml"):
+            print('\n[openrouter]\napi_key = "your_api_key_here"\n', file=sys.stderr)
+            print('Optional settings:\nmodel = "google/gemini-2.5-flash"\ntemperature = 0.4\n', file=sys.stderr)
+        else:
+            print("\n[openrouter]\napi_key = your_api_key_here\n", file=sys.stderr)
+            print("Optional settings:\nmodel = google/gemini-2.5-flash\ntemperature = 0.4\n", file=sys.stderr)
         print("Run 'glimpse.py --help' for more information on command-line options.", file=sys.stderr)
         sys.exit(1)
     
-    # Validate image path
-    image_path = Path(args.image_path)
-    if not image_path.exists():
-        print(f"Error: Image file not found: {args.image_path}", file=sys.stderr)
-        sys.exit(1)
-    
-    # Check file extension
-    if image_path.suffix.lower() not in ['.jpg', '.jpeg', '.png']:
-        print(f"Error: Unsupported image format. Please use JPG or PNG.", file=sys.stderr)
-        sys.exit(1)
+    # Validate image paths
+    for path in args.image_paths:
+        image_path = Path(path)
+        if not image_path.exists():
+            print(f"Error: Image file not found: {path}", file=sys.stderr)
+            sys.exit(1)
+        
+        # Check file extension
+        if image_path.suffix.lower() not in SUPPORTED_SUFFIXES:
+            print(f"Error: Unsupported image format. Please use JPG or PNG.", file=sys.stderr)
+            sys.exit(1)
     
     # Load configuration
     api_key, config_model, config_temperature = load_config()
@@ -338,11 +614,26 @@ def main():
     # Use command-line temperature if provided, otherwise use the one from config
     temperature = args.temperature if args.temperature is not None else config_temperature
     
-    # Analyze the image (silently)
-    result = analyze_image(args.image_path, args.prompt, api_key, model, temperature)
+    # Analyze the images (silently)
+    results = analyze_images(args.image_paths, args.prompt, api_key, model, temperature)
     
-    # Output only the result to stdout
-    print(result)
+    # Output only the results to stdout, labelled by file when there are several
+    if len(args.image_paths) == 1:
+        print(next(results))
+        return
+    
+    failed = False
+    for path, result in zip(args.image_paths, results):
+        if result is None:
+            print(f"Error: Could not analyze {path}", file=sys.stderr)
+            failed = True
+            continue
+        print(f"==> {path} <==")
+        print(result)
+        print()
+    
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":